@@ -1,310 +1,492 @@
 #!/usr/bin/env python3
 """Smart Workout Tracker
 
-CLI app to add workouts, analyze performance, and visualize progress.
+This script implements a small, recruiter-friendly CLI that:
+- stores workouts in a CSV file
+- computes simple analytics (frequency, total volume, PRs)
+- plots visual summaries using matplotlib
+
+The comments below are intentionally friendly and descriptive — think clear,
+conversational explanations you'd share in a well-documented college project.
 """
+
 from __future__ import annotations
+import atexit
 import csv
-from dataclasses import dataclass, asdict
-from datetime import datetime
+import io
+import os
+import sys
+from dataclasses import dataclass
+from datetime import date
 from typing import Optional
+
+import numpy as np
 import pandas as pd
+import matplotlib
+
+# On a Linux machine without a display (SSH sessions, CI) there is no window
+# to show charts in, so use the non-interactive Agg backend and save a PNG
+# instead. An explicit MPLBACKEND setting always wins.
+if (
+    sys.platform.startswith("linux")
+    and not os.environ.get("DISPLAY")
+    and not os.environ.get("WAYLAND_DISPLAY")
+    and "MPLBACKEND" not in os.environ
+):
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
-import os
 
+
+# Path to the CSV file that stores workouts. We keep it next to this script
+# so the project is self-contained and easy to inspect for recruiters.
 CSV_PATH = os.path.join(os.path.dirname(__file__), "workouts.csv")
-# CSV column format: date,exercise,sets,reps,weight,duration
+
+
+def _top_n_from_env(default: int = 20) -> int:
+    """Read WORKOUT_TRACKER_TOP_N, falling back to `default` unless it's a positive integer."""
+    try:
+        value = int(os.environ.get("WORKOUT_TRACKER_TOP_N", default))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+# Charts only show the top exercises so they stay readable (and quick to draw)
+# however many different exercises you log. The printed report is never cut.
+TOP_N = _top_n_from_env()
+
+# We define the canonical header order here so saved files are
+# consistent across machines and easy to open in Excel or pandas.
 # Example row: 2026-02-01,Push-ups,3,15,0,0
-# Keeping an explicit example here helps reviewers quickly understand the data layout.
+COLUMNS = ["date", "exercise", "sets", "reps", "weight", "duration"]
+# The report never looks at the date, so load_data skips parsing it.
+REPORT_COLUMNS = ["exercise", "sets", "reps", "weight", "duration"]
+# Values used for numeric columns that are missing from a CSV altogether.
+REPORT_DEFAULTS = {'sets': 0, 'reps': 0, 'weight': 0.0, 'duration': 0.0}
+# Exercise names repeat a lot (the same lifts every week), so store them as a
+# category: grouping then works on small integer codes, not strings.
+REPORT_DTYPES = {'exercise': 'category', 'sets': 'int64', 'reps': 'int64', 'weight': 'float64', 'duration': 'float64'}
+
+
+def report_chart_path(path: str = CSV_PATH) -> str:
+    """Return where the report charts for `path` are saved when there is no display.
+
+    Like the Parquet snapshot, the image sits next to the CSV it describes
+    (e.g. `workouts.csv.report.png`), so reports on different logs don't
+    overwrite each other.
+    """
+    return path + ".report.png"
+
+
+def parquet_cache_path(path: str = CSV_PATH) -> str:
+    """Return where the typed Parquet snapshot of `path` lives.
 
+    The CSV stays the source of truth (it is cheap to append to and easy to
+    read by eye); the Parquet file next to it is only a faster way to load it.
+    Its name keeps the full CSV file name (e.g. `workouts.csv.snapshot.parquet`)
+    so it never clashes with a Parquet file of your own.
+    """
+    return path + ".snapshot.parquet"
+
+
+# Smaller CSVs parse faster than a Parquet engine can even be imported, so they
+# never get a snapshot.
+SNAPSHOT_MIN_BYTES = 1024 * 1024
+
+# CSV files this run has already written a snapshot for; see _read_data.
+_snapshotted_paths: set[str] = set()
 
-@dataclass
+# The most recently loaded workout table, keyed by (path, mtime, size) of the CSV.
+_df_cache: Optional[tuple[tuple[str, int, int], pd.DataFrame]] = None
+
+# Workouts saved but not yet written to disk, grouped by CSV path.
+_PENDING: dict[str, list[tuple]] = {}
+# How many queued rows trigger a write; see save_workout.
+_FLUSH_EVERY = 64
+
+
+@dataclass(slots=True, frozen=True)
 class Workout:
-    date: str  # YYYY-MM-DD
+    """Simple data model for a single workout entry.
+
+    Fields:
+    - date: ISO date string (YYYY-MM-DD)
+    - exercise: name of the exercise or activity
+    - sets, reps, weight: for resistance training
+    - duration: minutes for cardio (set to 0 for strength work)
+
+    This class includes a convenience method `total_volume()` which computes
+    the training volume for resistance exercises (sets * reps * weight).
+    """
+
+    date: str
     exercise: str
     sets: int
     reps: int
     weight: float
-    duration: float  # minutes for cardio
+    duration: float
 
-    #!/usr/bin/env python3
-    """Smart Workout Tracker
+    def total_volume(self) -> float:
+        """Return the numeric training volume for this entry.
 
-    This script implements a small, recruiter-friendly CLI that:
-    - stores workouts in a CSV file
-    - computes simple analytics (frequency, total volume, PRs)
-    - plots visual summaries using matplotlib
+        No conversion happens here, so the fields must already be numbers, with
+        `weight` a float as its type says (prompt_for_workout always builds
+        them that way). An int weight such as ``0`` gives an int result.
+        """
+        # Note: bodyweight exercises typically have weight==0; callers can still
+        # rely on volume==0 while tracking reps/sets separately.
+        return self.sets * self.reps * self.weight
 
-    The comments below are intentionally friendly and descriptive — think clear,
-    conversational explanations you'd share in a well-documented college project.
-    """
 
-    from __future__ import annotations
-    import os
-    from dataclasses import dataclass, asdict
-    from datetime import datetime, date
-    from typing import Optional
+def ensure_csv(path: str = CSV_PATH) -> None:
+    """Create an empty CSV with the correct headers if it doesn't exist yet.
 
-    import pandas as pd
-    import matplotlib.pyplot as plt
+    This keeps the rest of the code simple because we can always assume the
+    CSV exists and has the expected columns. An existing but empty file gets
+    its header written too, so appends never need to check for one.
+    """
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        with open(path, "w", newline="") as f:
+            csv.writer(f, lineterminator="\n").writerow(COLUMNS)
 
 
-    # Path to the CSV file that stores workouts. We keep it next to this script
-    # so the project is self-contained and easy to inspect for recruiters.
-    CSV_PATH = os.path.join(os.path.dirname(__file__), "workouts.csv")
+def save_workout(workout: Workout, path: str = CSV_PATH) -> None:
+    """Queue a `Workout` to be appended to the CSV file.
 
+    Rows are buffered in memory and written `_FLUSH_EVERY` at a time, so a
+    script importing a long history opens the file once per batch instead of
+    once per workout. Call `flush_workouts()` to write queued rows right away;
+    anything still queued is written automatically when Python exits.
+    """
+    pending = _PENDING.setdefault(path, [])
+    pending.append((workout.date, workout.exercise, workout.sets, workout.reps, workout.weight, workout.duration))
+    if len(pending) >= _FLUSH_EVERY:
+        flush_workouts(path)
 
-    @dataclass
-    class Workout:
-        """Simple data model for a single workout entry.
 
-        Fields:
-        - date: ISO date string (YYYY-MM-DD)
-        - exercise: name of the exercise or activity
-        - sets, reps, weight: for resistance training
-        - duration: minutes for cardio (set to 0 for strength work)
+def flush_workouts(path: Optional[str] = None) -> None:
+    """Append all queued workouts for `path` (or for every file) to disk.
 
-        This class includes a convenience method `total_volume()` which computes
-        the training volume for resistance exercises (sets * reps * weight).
-        """
+    We stream the rows onto the end of the file with the standard `csv` module,
+    so saving stays just as fast whether the history has ten rows or ten thousand.
+    """
+    paths = list(_PENDING) if path is None else [path]
+    for p in paths:
+        rows = _PENDING.pop(p, None)
+        if not rows:
+            continue
+        ensure_csv(p)
+        # Append without rewriting the file; ensure_csv has already written the header.
+        with open(p, "a", newline="") as f:
+            csv.writer(f, lineterminator="\n").writerows(rows)
 
-        date: str
-        exercise: str
-        sets: int
-        reps: int
-        weight: float
-        duration: float
 
-        def total_volume(self) -> float:
-            """Return the numeric training volume for this entry.
+# Make sure queued rows aren't lost when the program exits.
+atexit.register(flush_workouts)
 
-            This gracefully returns 0.0 if any numeric fields are missing or invalid.
-            """
-            # Note: bodyweight exercises typically have weight==0; callers can still
-            # rely on volume==0 while tracking reps/sets separately.
-            try:
-                return float(self.sets) * float(self.reps) * float(self.weight)
-            except Exception:
-                return 0.0
 
+def bulk_add(rows: list[dict], path: str = CSV_PATH) -> None:
+    """Append many workouts (dicts keyed by `COLUMNS`) to the CSV in one write.
 
-    def ensure_csv(path: str = CSV_PATH) -> None:
-        """Create an empty CSV with the correct headers if it doesn't exist yet.
+    Handy for importing an existing training log. The DataFrame is built once
+    from the whole list of records and written with a single append.
+    Every record needs a date and an exercise; missing numeric fields default
+    to 0 (see `REPORT_DEFAULTS`) and keys outside `COLUMNS` are ignored. A
+    ValueError is raised, and nothing is written, if any record is invalid.
+    """
+    if not rows:
+        return
+    # Don't grow a DataFrame row by row with pd.concat in append paths: every
+    # call copies the whole table, so importing N rows would cost O(N^2).
+    df = pd.DataFrame(rows, columns=COLUMNS)
+    # Check the whole batch before writing, so one bad record can't leave a
+    # blank field in the log (which would push every later report onto the
+    # slow coercion path in _read_data).
+    incomplete = np.flatnonzero(df[['date', 'exercise']].isna().any(axis=1).to_numpy())
+    if incomplete.size:
+        raise ValueError(f"Records missing a date or exercise: {incomplete.tolist()}")
+    for col, default in REPORT_DEFAULTS.items():
+        # to_numeric raises ValueError on text that isn't a number.
+        df[col] = pd.to_numeric(df[col]).fillna(default).astype(REPORT_DTYPES[col])
+
+    # Keep anything already queued by save_workout ahead of this batch.
+    flush_workouts(path)
+    ensure_csv(path)
+    # Same line endings as the csv writers in ensure_csv and flush_workouts.
+    df.to_csv(path, mode="a", header=False, index=False, lineterminator="\n")
+
+
+def prompt_for_workout() -> Optional[Workout]:
+    """Interactively prompt the user for a workout record.
+
+    The prompts are intentionally forgiving: blank date defaults to today,
+    numeric fields are validated gently, and cardio is handled separately.
+    """
+    today = date.today().isoformat()
+    date_str = input(f"Date (YYYY-MM-DD) [{today}]: ").strip() or today
 
-        This keeps the rest of the code simple because we can always assume the
-        CSV exists and has the expected columns.
-        """
-        if not os.path.exists(path):
-            # We define the canonical header order here so saved files are
-            # consistent across machines and easy to open in Excel or pandas.
-            df = pd.DataFrame(columns=["date", "exercise", "sets", "reps", "weight", "duration"])
-            df.to_csv(path, index=False)
+    exercise = input("Exercise name: ").strip()
+    if not exercise:
+        print("Exercise name is required — please try again.")
+        return None
 
+    # Quick check: is this cardio work? Cardio entries record duration only.
+    cardio_ans = input("Is this cardio? (y/N): ").strip().lower()
+    if cardio_ans == "y":
+        try:
+            duration = float(input("Duration (minutes): ").strip() or 0)
+        except ValueError:
+            print("Could not parse duration, defaulting to 0.")
+            duration = 0.0
+        return Workout(date=date_str, exercise=exercise, sets=0, reps=0, weight=0.0, duration=duration)
 
-    def save_workout(workout: Workout, path: str = CSV_PATH) -> None:
-        """Append a `Workout` to the CSV file using pandas.
+    # If it's not cardio, we collect strength metrics. The UI keeps it simple
+    # but ensures that values are numbers — we avoid crashing on bad user input.
+    # Strength-type entry: ask for sets/reps/weight and validate inputs.
+    try:
+        sets = int(input("Sets: ").strip() or 0)
+        reps = int(input("Reps per set: ").strip() or 0)
+        weight = float(input("Weight (per rep, use 0 for bodyweight): ").strip() or 0.0)
+    except ValueError:
+        print("Invalid number entered — please try again.")
+        return None
 
-        Using pandas here makes the CSV handling robust and concise; it also keeps
-        the file easily readable for recruiters who want to peek at sample data.
-        """
-        ensure_csv(path)
-        row = pd.DataFrame([asdict(workout)])
-        # Append without rewriting the entire file header each time.
-        # If the file doesn't exist or is empty, write headers. Otherwise append.
-        header = not os.path.exists(path) or os.path.getsize(path) == 0
-        row.to_csv(path, mode="a", header=header, index=False)
-        # Friendly confirmation so interactive users know their input was saved.
-        # (Helps during demos where people want immediate feedback.)
+    return Workout(date=date_str, exercise=exercise, sets=sets, reps=reps, weight=weight, duration=0.0)
 
 
-    def prompt_for_workout() -> Optional[Workout]:
-        """Interactively prompt the user for a workout record.
+def load_data(path: str = CSV_PATH) -> pd.DataFrame:
+    """Load the CSV into a pandas DataFrame and normalize column types.
 
-        The prompts are intentionally forgiving: blank date defaults to today,
-        numeric fields are validated gently, and cardio is handled separately.
-        """
-        today = date.today().isoformat()
-        date_str = input(f"Date (YYYY-MM-DD) [{today}]: ").strip() or today
-
-        exercise = input("Exercise name: ").strip()
-        if not exercise:
-            print("Exercise name is required — please try again.")
-            return None
-
-        # Quick check: is this cardio work? Cardio entries record duration only.
-        cardio_ans = input("Is this cardio? (y/N): ").strip().lower()
-        if cardio_ans == "y":
-            try:
-                duration = float(input("Duration (minutes): ").strip() or 0)
-            except ValueError:
-                print("Could not parse duration, defaulting to 0.")
-                duration = 0.0
-            return Workout(date=date_str, exercise=exercise, sets=0, reps=0, weight=0.0, duration=duration)
-
-        # If it's not cardio, we collect strength metrics. The UI keeps it simple
-        # but ensures that values are numbers — we avoid crashing on bad user input.
-        # Strength-type entry: ask for sets/reps/weight and validate inputs.
+    Returning a DataFrame simplifies downstream reporting and plotting logic.
+    Only the columns the report uses (`REPORT_COLUMNS`) are loaded. The parsed
+    frame is remembered for the rest of the session, so generating the report
+    again without adding a workout doesn't touch the disk at all.
+    """
+    global _df_cache
+    # Write any queued workouts first so the report includes them.
+    flush_workouts(path)
+    ensure_csv(path)
+    # Any write to the CSV changes its modification time or size, which
+    # invalidates the cached frame automatically.
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    if _df_cache is None or _df_cache[0] != key:
+        _df_cache = (key, _read_data(path))
+    # A shallow copy lets callers add columns without touching the cached frame.
+    return _df_cache[1].copy(deep=False)
+
+
+def _read_data(path: str) -> pd.DataFrame:
+    """Read and clean the workout CSV at `path`, bypassing the session cache.
+
+    When a Parquet engine (pyarrow or fastparquet) is installed and the CSV is
+    at least `SNAPSHOT_MIN_BYTES`, the cleaned-up frame is also saved as a
+    Parquet snapshot and reused until the CSV changes.
+    """
+    cache_path = parquet_cache_path(path)
+    # The snapshot records which version of the CSV it was built from (its exact
+    # modification time and size) in a small `.key` file next to it. Comparing
+    # for equality rather than "snapshot is newer" also catches a CSV that was
+    # replaced by an older file, e.g. restored from a backup.
+    key_path = cache_path + ".key"
+    stat = os.stat(path)
+    source_key = f"{stat.st_mtime_ns} {stat.st_size}"
+    use_snapshot = stat.st_size >= SNAPSHOT_MIN_BYTES
+    fresh = False
+    if use_snapshot:
         try:
-            sets = int(input("Sets: ").strip() or 0)
-            reps = int(input("Reps per set: ").strip() or 0)
-            weight = float(input("Weight (per rep, use 0 for bodyweight): ").strip() or 0.0)
-        except ValueError:
-            print("Invalid number entered — please try again.")
-            return None
+            with open(key_path) as f:
+                fresh = f.read() == source_key
+        except OSError:
+            pass
+    # Fast path: the snapshot already has the right dtypes, so no re-parsing
+    # or type coercion is needed as long as it matches the CSV.
+    if fresh:
+        try:
+            return pd.read_parquet(cache_path, columns=REPORT_COLUMNS)
+        except (ImportError, OSError, ValueError):
+            pass  # no Parquet engine, or an unreadable snapshot: fall back to the CSV
 
-        return Workout(date=date_str, exercise=exercise, sets=sets, reps=reps, weight=weight, duration=0.0)
+    # Picking columns by name (rather than a fixed list) keeps older or
+    # hand-made files that lack a column readable; see _add_missing_columns.
+    usecols = REPORT_COLUMNS.__contains__
+    try:
+        # Rows written by this app are always well-formed, so parse them straight
+        # into their final types with no extra clean-up pass.
+        df = _add_missing_columns(pd.read_csv(path, usecols=usecols, dtype=REPORT_DTYPES, engine='c'))
+    except ValueError:
+        # A hand-edited file may contain blanks or stray text in numeric columns.
+        # Only then read it loosely and coerce numbers, filling gaps sensibly.
+        df = _add_missing_columns(pd.read_csv(path, usecols=usecols, dtype={'exercise': 'category'}, engine='c'))
+        for col, default in REPORT_DEFAULTS.items():
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(default)
+        # Cast to the same types as the typed read above, so the printed report
+        # and the Parquet snapshot look the same whichever path was taken.
+        df = df.astype(REPORT_DTYPES)
+
+    # Rewriting the whole table after every new workout would make each report
+    # in an add/report session pay for a Parquet write on top of the CSV parse.
+    # The in-memory cache in load_data already covers repeat reports, so write
+    # the snapshot at most once per file per run: the next run starts from it.
+    if use_snapshot and path not in _snapshotted_paths:
+        _snapshotted_paths.add(path)
+        try:
+            # Drop the old key first so a half-written snapshot is never trusted.
+            if os.path.exists(key_path):
+                os.remove(key_path)
+            df.to_parquet(cache_path, index=False)
+            with open(key_path, "w") as f:
+                f.write(source_key)
+        except (ImportError, OSError, ValueError):
+            pass  # Parquet is an optional speed-up; the CSV alone is always enough
 
+    return df
 
-    def load_data(path: str = CSV_PATH) -> pd.DataFrame:
-        """Load the CSV into a pandas DataFrame and normalize column types.
 
-        Returning a DataFrame simplifies downstream reporting and plotting logic.
-        """
-        ensure_csv(path)
-        if os.path.exists(path) and os.path.getsize(path) > 0:
-            df = pd.read_csv(path)
-        else:
-            df = pd.DataFrame(columns=["date", "exercise", "sets", "reps", "weight", "duration"])  # type: ignore
+def _add_missing_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Fill in any numeric report column the CSV doesn't have with its default."""
+    for col, default in REPORT_DEFAULTS.items():
+        if col not in df:
+            df[col] = default
+    return df
 
-        # Coerce numeric types and fill missing values sensibly.
-        df['sets'] = pd.to_numeric(df.get('sets', 0), errors='coerce').fillna(0).astype(int)
-        df['reps'] = pd.to_numeric(df.get('reps', 0), errors='coerce').fillna(0).astype(int)
-        df['weight'] = pd.to_numeric(df.get('weight', 0.0), errors='coerce').fillna(0.0)
-        df['duration'] = pd.to_numeric(df.get('duration', 0.0), errors='coerce').fillna(0.0)
 
-        return df
+def aggregate_by_group(codes: np.ndarray, volume: np.ndarray, n_groups: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (count, total volume, max volume) for each group code.
 
+    `codes` holds a group number in ``range(n_groups)`` for every row (rows
+    with a negative code, e.g. a missing exercise name, are ignored). Each
+    statistic is a single linear pass over the rows instead of a hash groupby.
+    """
+    valid = codes >= 0
+    if not valid.all():
+        codes, volume = codes[valid], volume[valid]
+    freq = np.bincount(codes, minlength=n_groups)
+    total = np.bincount(codes, weights=volume, minlength=n_groups)
+    pr = np.full(n_groups, -np.inf)
+    # ufunc.at only became a fast indexed loop in NumPy 1.25, hence the
+    # minimum version in requirements.txt.
+    np.maximum.at(pr, codes, volume)
+    return freq, total, pr
+
+
+def generate_report(path: str = CSV_PATH) -> None:
+    """Compute and print summary statistics, then show charts.
+
+    The printed output is concise for quick inspection, while the charts give
+    an immediate visual summary recruiters (and humans) appreciate.
+    """
+    df = load_data(path)
+    if df.empty:
+        print("No workouts logged yet — add your first workout to get started.")
+        return
+
+    # Compute per-row training volume for strength entries. Multiplying the
+    # raw NumPy arrays skips pandas' index alignment between the columns.
+    df['volume'] = df['sets'].to_numpy() * df['reps'].to_numpy() * df['weight'].to_numpy()
+
+    # One grouped pass computes every per-exercise statistic at once:
+    # - freq: how many sessions per exercise
+    # - total_vol: total accumulated volume across all sessions
+    # - pr: personal record, the highest single-session volume
+    # Exercises are numbered in order of first appearance; each column is
+    # re-sorted by value below, so the key order itself doesn't matter.
+    # `exercise` is categorical, so this only renumbers its integer codes.
+    codes, exercises = pd.factorize(df['exercise'])
+    freq_arr, total_arr, pr_arr = aggregate_by_group(codes, df['volume'].to_numpy(), len(exercises))
+    summary = pd.DataFrame(
+        {'freq': freq_arr, 'total_vol': total_arr, 'pr': pr_arr},
+        index=pd.Index(exercises, name='exercise'),
+    )
+
+    # The text report is collected in memory and written to the terminal in one go.
+    out = io.StringIO()
+
+    freq = summary['freq'].sort_values(ascending=False)
+    print("\nWorkout frequency per exercise:", file=out)
+    print(freq.to_string(), file=out)
+
+    total_vol = summary['total_vol'].sort_values(ascending=False)
+    print("\nTotal volume per exercise:", file=out)
+    print(total_vol.to_string(), file=out)
+
+    pr = summary['pr'].sort_values(ascending=False)
+    print("\nPersonal records (max single-session volume):", file=out)
+    print(pr.to_string(), file=out)
+
+    # Cardio summary: total minutes
+    cardio_total = df['duration'].sum()
+    print(f"\nTotal cardio duration (minutes): {cardio_total}", file=out)
+
+    sys.stdout.write(out.getvalue())
+
+    # Plotting: two simple bar charts side by side in a single window
+    try:
+        # We attempt to display charts; in CI or headless servers this may fail,
+        # which is why we catch exceptions. Local users (or recruiters) will
+        # typically see the visuals in an interactive session.
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 5))
+        freq.head(TOP_N).plot(kind='bar', ax=ax1, title='Workout Frequency per Exercise')
+        ax1.set_xlabel('Exercise')
+        ax1.set_ylabel('Sessions')
+
+        total_vol.head(TOP_N).plot(kind='bar', ax=ax2, title='Total Volume per Exercise')
+        ax2.set_xlabel('Exercise')
+        ax2.set_ylabel('Total Volume (sets * reps * weight)')
+
+        fig.tight_layout()
+        if matplotlib.get_backend().lower() == 'agg':
+            chart_path = report_chart_path(path)
+            fig.savefig(chart_path)
+            print(f"\nCharts saved to {chart_path}")
+        else:
+            plt.show()
+        # Release the figure so repeated reports in one session don't pile up memory.
+        plt.close(fig)
+    except Exception as exc:
+        # We catch plotting errors so headless environments don't crash the CLI.
+        print(f"Could not display charts: {exc}")
 
-    def generate_report(path: str = CSV_PATH) -> None:
-        """Compute and print summary statistics, then show charts.
 
-        The printed output is concise for quick inspection, while the charts give
-        an immediate visual summary recruiters (and humans) appreciate.
-        """
-        df = load_data(path)
-        if df.empty:
-            print("No workouts logged yet — add your first workout to get started.")
-            return
-
-        # Compute per-row training volume for strength entries
-        df['volume'] = df['sets'] * df['reps'] * df['weight']
-
-        # Frequency: how many sessions per exercise
-        freq = df.groupby('exercise').size().sort_values(ascending=False)
-        print("\nWorkout frequency per exercise:")
-        print(freq.to_string())
-
-        # Total accumulated volume per exercise across all sessions
-        total_vol = df.groupby('exercise')['volume'].sum().sort_values(ascending=False)
-        print("\nTotal volume per exercise:")
-        print(total_vol.to_string())
-
-        # Personal records: the highest single-session volume per exercise
-        pr = df.groupby('exercise')['volume'].max().sort_values(ascending=False)
-        print("\nPersonal records (max single-session volume):")
-        print(pr.to_string())
-
-        # Cardio summary: total minutes
-        cardio_total = df['duration'].sum()
-        print(f"\nTotal cardio duration (minutes): {cardio_total}")
-
-        # Plotting: two simple bar charts that pop up automatically
-        try:
-            # We attempt to display charts; in CI or headless servers this may fail,
-            # which is why we catch exceptions. Local users (or recruiters) will
-            # typically see the visuals in an interactive session.
-            plt.figure(figsize=(10, 5))
-            freq.plot(kind='bar', title='Workout Frequency per Exercise')
-            plt.xlabel('Exercise')
-            plt.ylabel('Sessions')
-            plt.tight_layout()
-            plt.show()
+def add_workout_interactive() -> None:
+    """Prompt for one workout and save it if the input was valid."""
+    w = prompt_for_workout()
+    if w:
+        save_workout(w)
+        # Interactive entries go straight to disk rather than waiting for a full batch.
+        flush_workouts()
+        print("Saved.")
 
-            plt.figure(figsize=(10, 5))
-            total_vol.plot(kind='bar', title='Total Volume per Exercise')
-            plt.xlabel('Exercise')
-            plt.ylabel('Total Volume (sets * reps * weight)')
-            plt.tight_layout()
-            plt.show()
-        except Exception as exc:
-            # We catch plotting errors so headless environments don't crash the CLI.
-            print(f"Could not display charts: {exc}")
 
+# The menu banner is written in one go rather than line by line.
+_MENU = "\nSmart Workout Tracker\n1) Add workout\n2) Generate report\n3) Exit\n"
 
-    def main_menu() -> None:
-        """Main command-line loop offering a small menu of actions.
+# Menu choices that run an action and then return to the menu.
+_ACTIONS = {
+    '1': add_workout_interactive,
+    '2': generate_report,
+}
 
-        This keeps the UX straightforward for quick demos and manual testing.
-        """
-        ensure_csv(CSV_PATH)
-        while True:
-            print("\nSmart Workout Tracker")
-            print("1) Add workout")
-            print("2) Generate report")
-            print("3) Exit")
-            choice = input("Choose an option: ").strip()
-            if choice == '1':
-                w = prompt_for_workout()
-                if w:
-                    save_workout(w)
-                    print("Saved.")
-            elif choice == '2':
-                generate_report()
-            elif choice == '3':
-                print("Goodbye — keep up the great workouts!")
-                break
-            else:
-                print("Sorry, I didn't understand that. Please enter 1, 2, or 3.")
-
-
-    if __name__ == '__main__':
-        main_menu()
-
-    print(f"\nTotal cardio duration (minutes): {cardio_total}")
-
-    # Visualizations
-    try:
-        plt.style.use("seaborn-v0_8")
-    except Exception:
-        pass
-
-    # Frequency chart
-    if not freq.empty:
-        ax = freq.plot(kind="bar", figsize=(8, 5), title="Workout Frequency per Exercise")
-        ax.set_xlabel("Exercise")
-        ax.set_ylabel("Sessions")
-        plt.tight_layout()
-        plt.show()
-
-    # Total volume chart
-    if not total_volume.empty:
-        ax2 = total_volume.plot(kind="bar", figsize=(8, 5), title="Total Volume per Exercise")
-        ax2.set_xlabel("Exercise")
-        ax2.set_ylabel("Total Volume (sets * reps * weight)")
-        plt.tight_layout()
-        plt.show()
-
-
-def main_loop() -> None:
+
+def main_menu() -> None:
+    """Main command-line loop offering a small menu of actions.
+
+    This keeps the UX straightforward for quick demos and manual testing.
+    """
     ensure_csv(CSV_PATH)
     while True:
-        print("\nSmart Workout Tracker")
-        print("1) Add workout")
-        print("2) Generate report")
-        print("3) Exit")
+        sys.stdout.write(_MENU)
         choice = input("Choose an option: ").strip()
-        if choice == "1":
-            w = prompt_for_workout()
-            if w:
-                save_workout(w)
-        elif choice == "2":
-            generate_report()
-        elif choice == "3":
-            print("Goodbye!")
+        action = _ACTIONS.get(choice)
+        if action is not None:
+            action()
+        elif choice == '3':
+            print("Goodbye — keep up the great workouts!")
             break
         else:
-            print("Invalid choice.")
+            print("Sorry, I didn't understand that. Please enter 1, 2, or 3.")
 
 
-if __name__ == "__main__":
-    main_loop()
+if __name__ == '__main__':
+    main_menu()